@@ -6,9 +6,33 @@ Calculates how accurate the model predictions are
 import sys
 import os
 
+import numpy as np
+
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
 
-from utils import load_data, load_theta, estimate_price
+from utils import load_data, load_theta, make_predictor
+
+
+def _r_squared(actual, residuals):
+    """R² from float64 actual values and precomputed residuals"""
+    deviations = actual - actual.mean()
+
+    ss_res = np.dot(residuals, residuals)
+    ss_tot = np.dot(deviations, deviations)
+
+    if ss_tot == 0:
+        return 0
+
+    return float(1 - (ss_res / ss_tot))
+
+
+def _mape(actual, residuals):
+    """MAPE from float64 actual values and precomputed residuals"""
+    mask = actual != 0
+    if not mask.any():
+        return 0.0
+
+    return float(np.abs(residuals[mask] / actual[mask]).mean()) * 100
 
 
 def calculate_r_squared(actual, predicted):
@@ -18,16 +42,10 @@ def calculate_r_squared(actual, predicted):
 
     Range: 0 to 1 (1 = perfect prediction)
     """
-    n = len(actual)
-    mean_actual = sum(actual) / n
+    a = np.asarray(actual, dtype=np.float64)
+    p = np.asarray(predicted, dtype=np.float64)
 
-    ss_tot = sum((y - mean_actual) ** 2 for y in actual)
-    ss_res = sum((y - pred) ** 2 for y, pred in zip(actual, predicted))
-
-    if ss_tot == 0:
-        return 0
-
-    return 1 - (ss_res / ss_tot)
+    return _r_squared(a, a - p)
 
 
 def calculate_mape(actual, predicted):
@@ -35,11 +53,29 @@ def calculate_mape(actual, predicted):
     Calculate MAPE (Mean Absolute Percentage Error)
     MAPE = (1/n) × Σ|actual - predicted| / actual × 100
 
+    Samples with actual = 0 are skipped (percentage undefined)
+
     Returns: error rate in percentage
     """
-    n = len(actual)
-    total_error = sum(abs(a - p) / a for a, p in zip(actual, predicted))
-    return (total_error / n) * 100
+    a = np.asarray(actual, dtype=np.float64)
+    p = np.asarray(predicted, dtype=np.float64)
+
+    return _mape(a, a - p)
+
+
+def compute_all_metrics(actual, predicted):
+    """
+    Calculate R² and MAPE in a single pass over the residuals
+    Residuals are computed once and shared by every metric
+
+    Returns: dict with 'r2' and 'mape' keys
+    """
+    a = np.asarray(actual, dtype=np.float64)
+    p = np.asarray(predicted, dtype=np.float64)
+
+    residuals = a - p
+
+    return {'r2': _r_squared(a, residuals), 'mape': _mape(a, residuals)}
 
 
 def main():
@@ -55,12 +91,18 @@ def main():
         print("Error: Model not trained. Run train.py first.")
         return
 
+    # Convert once so every metric reuses the same arrays
+    mileages = np.asarray(mileages, dtype=np.float64)
+    prices = np.asarray(prices, dtype=np.float64)
+
     # Calculate predictions
-    predictions = [estimate_price(km, theta0, theta1) for km in mileages]
+    predict = make_predictor(theta0, theta1)
+    predictions = predict(mileages)
 
     # Calculate metrics
-    r2 = calculate_r_squared(prices, predictions)
-    mape = calculate_mape(prices, predictions)
+    metrics = compute_all_metrics(prices, predictions)
+    r2 = metrics['r2']
+    mape = metrics['mape']
     accuracy = 100 - mape
 
     # Display result
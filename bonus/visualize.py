@@ -7,26 +7,20 @@ Bonus: Data visualization with regression line
 import sys
 import os
 
-sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
-
-try:
-    import matplotlib.pyplot as plt
-except ImportError:
-    print("Error: matplotlib required. Install with: pip install matplotlib")
-    sys.exit(1)
+import numpy as np
 
-from utils import load_data, load_theta, estimate_price
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
 
+from utils import load_data, load_theta, make_predictor
 
-def main():
-    # Load data
-    mileages, prices = load_data('data/data.csv')
-    if mileages is None:
-        print("Error: Cannot load data")
-        return
 
-    # Load model
-    theta0, theta1, _ = load_theta('models/theta.json')
+def plot_regression(mileages, prices, theta0, theta1):
+    """Plot the training data and, if trained, the regression line"""
+    try:
+        import matplotlib.pyplot as plt
+    except ImportError:
+        print("Error: matplotlib required. Install with: pip install matplotlib")
+        sys.exit(1)
 
     # Create plot
     plt.figure(figsize=(10, 6))
@@ -36,8 +30,9 @@ def main():
 
     # 2. Regression line (if trained)
     if theta0 != 0 or theta1 != 0:
-        x_line = [min(mileages), max(mileages)]
-        y_line = [estimate_price(x, theta0, theta1) for x in x_line]
+        x_line = np.array([mileages.min(), mileages.max()])
+        predict = make_predictor(theta0, theta1)
+        y_line = predict(x_line)
         plt.plot(x_line, y_line, color='red', linewidth=2, label='Regression Line')
 
     plt.xlabel('Mileage (km)')
@@ -48,5 +43,18 @@ def main():
     plt.show()
 
 
+def main():
+    # Load data
+    mileages, prices = load_data('data/data.csv')
+    if mileages is None:
+        print("Error: Cannot load data")
+        return
+
+    # Load model
+    theta0, theta1, _ = load_theta('models/theta.json')
+
+    plot_regression(mileages, prices, theta0, theta1)
+
+
 if __name__ == "__main__":
     main()
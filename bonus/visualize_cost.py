@@ -5,75 +5,88 @@ Shows how cost decreases during gradient descent
 """
 import sys
 import os
+import argparse
 
-sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+import numpy as np
 
-try:
-    import matplotlib.pyplot as plt
-except ImportError:
-    print("Error: matplotlib required. Install with: pip install matplotlib")
-    sys.exit(1)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
 
-from utils import load_data, normalize_data, estimate_price, calculate_cost
+from utils import load_data, normalize_pair, load_cost_history
+from train import gradient_descent
 
 
 def gradient_descent_with_history(mileages, prices, learning_rate=0.01, iterations=1000):
-    """Run gradient descent and return cost history"""
-    m = len(prices)
-    theta0 = 0.0
-    theta1 = 0.0
-    cost_history = []
+    """Run gradient descent and return cost history as a float64 ndarray"""
+    _, _, cost_history = gradient_descent(
+        mileages, prices,
+        learning_rate=learning_rate,
+        iterations=iterations,
+        verbose=False
+    )
+    return cost_history
 
-    for _ in range(iterations):
-        predictions = [estimate_price(km, theta0, theta1) for km in mileages]
-        errors = [pred - actual for pred, actual in zip(predictions, prices)]
 
-        gradient_theta0 = sum(errors) / m
-        gradient_theta1 = sum(err * km for err, km in zip(errors, mileages)) / m
+def plot_cost_history(cost_history, unit='iteration'):
+    """Plot cost per iteration (or epoch) and mark the convergence point"""
+    try:
+        import matplotlib.pyplot as plt
+    except ImportError:
+        print("Error: matplotlib required. Install with: pip install matplotlib")
+        sys.exit(1)
 
-        tmp_theta0 = theta0 - (learning_rate * gradient_theta0)
-        tmp_theta1 = theta1 - (learning_rate * gradient_theta1)
+    plt.figure(figsize=(10, 6))
+    plt.plot(cost_history, color='blue', linewidth=2)
+    plt.xlabel(unit.capitalize())
+    plt.ylabel('Cost (MSE)')
+    plt.title(f'Gradient Descent: Cost vs {unit.capitalize()}s')
+    plt.grid(True, alpha=0.3)
 
-        theta0 = tmp_theta0
-        theta1 = tmp_theta1
+    # Mark convergence point (first step where cost changes by < 0.0001)
+    converged = np.abs(np.diff(cost_history)) < 0.0001
+    if converged.any():
+        i = int(converged.argmax()) + 1
+        plt.axvline(x=i, color='red', linestyle='--', label=f'Converged at {unit} {i}')
 
-        cost = calculate_cost(mileages, prices, theta0, theta1)
-        cost_history.append(cost)
+    plt.legend()
+    plt.show()
 
-    return cost_history
+
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Plot cost during gradient descent")
+    parser.add_argument(
+        '--retrain', action='store_true',
+        help="ignore models/cost_history.npy and run gradient descent afresh"
+    )
+    return parser.parse_args()
 
 
 def main():
-    # Load and normalize data
+    args = parse_args()
+
+    # Reuse the history saved by train.py when available
+    if not args.retrain:
+        cost_history, unit = load_cost_history('models/cost_history.npy')
+        if cost_history is not None:
+            print(f"Plotting cost history saved by train.py "
+                  f"(models/cost_history.npy, one cost per {unit})")
+            print("Use --retrain to run gradient descent on the current data")
+            plot_cost_history(cost_history, unit)
+            return
+
+    # Otherwise load and normalize data
     mileages, prices = load_data('data/data.csv')
     if mileages is None:
         print("Error: Cannot load data")
         return
 
-    norm_mileages, _, _ = normalize_data(mileages)
-    norm_prices, _, _ = normalize_data(prices)
+    (norm_mileages, norm_prices), _, _ = normalize_pair(mileages, prices)
 
     # Train and get cost history
-    print("Training model...")
+    print("Training model on data/data.csv...")
     cost_history = gradient_descent_with_history(norm_mileages, norm_prices)
 
-    # Plot
-    plt.figure(figsize=(10, 6))
-    plt.plot(cost_history, color='blue', linewidth=2)
-    plt.xlabel('Iteration')
-    plt.ylabel('Cost (MSE)')
-    plt.title('Gradient Descent: Cost vs Iterations')
-    plt.grid(True, alpha=0.3)
-
-    # Mark convergence point
-    for i in range(1, len(cost_history)):
-        if abs(cost_history[i] - cost_history[i-1]) < 0.0001:
-            plt.axvline(x=i, color='red', linestyle='--', label=f'Converged at iteration {i}')
-            break
-
-    plt.legend()
-    plt.show()
-
+    plot_cost_history(cost_history)
 
 if __name__ == "__main__":
     main()
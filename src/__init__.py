@@ -0,0 +1,3 @@
+"""
+ft_linear_regression training, prediction and helper modules
+"""
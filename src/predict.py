@@ -4,12 +4,15 @@ Prediction program for linear regression model
 Estimates car price based on mileage
 """
 import sys
-import os
 
-# Add parent directory to path to import utils
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import numpy as np
 
-from utils import load_theta, estimate_price
+# Relative import under python3 -m src.predict; plain import when run as
+# python3 src/predict.py
+try:
+    from .utils import load_theta, estimate_price
+except ImportError:
+    from utils import load_theta, estimate_price
 
 
 def get_mileage_input():
@@ -44,9 +47,49 @@ def get_mileage_input():
         sys.exit(0)
 
 
+def predict_batch(theta0, theta1):
+    """
+    Read mileages from stdin (one per line) and print one price per line
+
+    All values are estimated with a single vectorized evaluation
+    """
+    if theta0 == 0 and theta1 == 0:
+        print("⚠️  Warning: Model not trained yet! Using θ₀=0, θ₁=0. "
+              "Run train.py first.", file=sys.stderr)
+
+    # Blank lines are ignored; nothing to predict if there is no data
+    lines = [line for line in sys.stdin.read().splitlines() if line.strip()]
+    if not lines:
+        return
+
+    try:
+        mileages = np.loadtxt(lines, dtype=np.float64, ndmin=2)
+    except ValueError:
+        print("❌ Error: Please enter valid numbers", file=sys.stderr)
+        sys.exit(1)
+
+    if mileages.shape[1] != 1:
+        print("❌ Error: Please enter one mileage per line", file=sys.stderr)
+        sys.exit(1)
+
+    mileages = mileages.ravel()
+
+    if (mileages < 0).any():
+        print("❌ Error: Mileage cannot be negative", file=sys.stderr)
+        sys.exit(1)
+
+    np.savetxt(sys.stdout, estimate_price(mileages, theta0, theta1), fmt='%.2f')
+
+
 def main():
     """Main prediction function"""
 
+    # Non-interactive mode: python3 src/predict.py --batch < mileages.txt
+    if '--batch' in sys.argv[1:]:
+        theta0, theta1, _ = load_theta('models/theta.json')
+        predict_batch(theta0, theta1)
+        return
+
     print("\n" + "="*60)
     print("  CAR PRICE ESTIMATOR")
     print("="*60 + "\n")
@@ -3,41 +3,189 @@
 Training program for linear regression model
 Implements gradient descent algorithm from scratch
 """
-import sys
-import os
+import argparse
+
+import numpy as np
+
+# Relative import under python3 -m src.train; plain import when run as
+# python3 src/train.py or imported as 'train' by the bonus scripts
+try:
+    from .utils import (
+        load_data,
+        normalize_pair,
+        denormalize_theta,
+        fit_closed_form,
+        save_theta,
+        save_cost_history,
+        remove_cost_history,
+        estimate_price
+    )
+except ImportError:
+    from utils import (
+        load_data,
+        normalize_pair,
+        denormalize_theta,
+        fit_closed_form,
+        save_theta,
+        save_cost_history,
+        remove_cost_history,
+        estimate_price
+    )
+
+# Print a progress line every LOG_EVERY iterations
+LOG_EVERY = 100
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    # Eager signature for the C-contiguous float64 arrays that
+    # gradient_descent passes in: no type dispatch, unit-stride loads
+    _GD_KERNEL_SIGNATURE = (
+        'Tuple((f8, f8, f8[::1]))(f8[::1], f8[::1], f8, f8, f8, i8, b1)'
+    )
+
+    @njit(_GD_KERNEL_SIGNATURE, fastmath=True, cache=True, boundscheck=False)
+    def _gd_kernel(mileages, prices, theta0, theta1, learning_rate, iterations,
+                   track_cost):
+        """
+        Compiled gradient descent steps starting from (theta0, theta1)
+
+        Errors, both gradient sums and the cost are accumulated in a
+        single pass over the samples, without temporary arrays.
+
+        Returns:
+            tuple: (theta0, theta1, cost_history) after `iterations` steps;
+                   cost_history is empty when track_cost is False
+        """
+        m = mileages.shape[0]
+        cost_history = np.empty(iterations if track_cost else 0)
+
+        for it in range(iterations):
+            s0 = 0.0
+            s1 = 0.0
+            c = 0.0
+            for j in range(m):
+                e = theta0 + theta1 * mileages[j] - prices[j]
+                s0 += e
+                s1 += e * mileages[j]
+                if track_cost:
+                    c += e * e
+
+            if track_cost:
+                cost_history[it] = c / (2 * m)
+            theta0, theta1 = (theta0 - learning_rate * s0 / m,
+                              theta1 - learning_rate * s1 / m)
+
+        return theta0, theta1, cost_history
+
+
+def _print_progress(i, cost, theta0, theta1):
+    """Print one progress line of gradient descent (cost may be None)"""
+    cost_str = f"{cost:.6f}" if cost is not None else "   n/a  "
+    print(f"Iteration {i:4d} | Cost: {cost_str} | "
+          f"θ₀: {theta0:8.4f} | θ₁: {theta1:8.4f}")
+
+
+def _gradient_step(mileages, prices, theta0, theta1, learning_rate):
+    """
+    One simultaneous update of theta0 and theta1 over the given samples
+
+    Returns:
+        tuple: (theta0, theta1, errors) with errors of the pre-update thetas
+    """
+    m = prices.shape[0]
+
+    # Calculate errors for all samples in one vectorized pass
+    errors = estimate_price(mileages, theta0, theta1) - prices
 
-# Add parent directory to path to import utils
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    # Calculate gradients (from PDF formulas)
+    # tmpθ₀ = learningRate × (1/m) × Σ(errors)
+    # tmpθ₁ = learningRate × (1/m) × Σ(errors × mileage)
 
-from utils import (
-    load_data,
-    normalize_data,
-    denormalize_theta,
-    save_theta,
-    estimate_price,
-    calculate_cost
-)
+    gradient_theta0 = errors.mean()
+    gradient_theta1 = (errors @ mileages) / m
+
+    # Update parameters SIMULTANEOUSLY
+    tmp_theta0 = theta0 - (learning_rate * gradient_theta0)
+    tmp_theta1 = theta1 - (learning_rate * gradient_theta1)
+
+    return float(tmp_theta0), float(tmp_theta1), errors
+
+
+def _gd_segment(mileages, prices, theta0, theta1, learning_rate, iterations,
+                cost_out=None, batch_size=None, shuffle=True):
+    """
+    Run NumPy gradient descent iterations from (theta0, theta1)
+
+    If cost_out is given, the cost before each iteration's update is
+    written into it; otherwise no cost is computed.
+
+    Returns:
+        tuple: (theta0, theta1) after the last iteration
+    """
+    m = prices.shape[0]
+
+    for i in range(iterations):
+        if batch_size is None:
+            theta0, theta1, errors = _gradient_step(
+                mileages, prices, theta0, theta1, learning_rate
+            )
+        else:
+            # Full-dataset errors for the cost, then one update per batch
+            if cost_out is not None:
+                errors = estimate_price(mileages, theta0, theta1) - prices
+            order = np.random.permutation(m) if shuffle else np.arange(m)
+            for start in range(0, m, batch_size):
+                batch = order[start:start + batch_size]
+                theta0, theta1, _ = _gradient_step(
+                    mileages[batch], prices[batch],
+                    theta0, theta1, learning_rate
+                )
+
+        # Cost of the thetas before this iteration, reusing their errors
+        if cost_out is not None:
+            cost_out[i] = float(errors @ errors) / (2 * m)
+
+    return theta0, theta1
 
 
 def gradient_descent(mileages, prices, learning_rate=0.01, iterations=1000,
-                     verbose=True):
+                     verbose=True, batch_size=None, shuffle=True,
+                     track_cost=True):
     """
     Perform gradient descent to learn theta0 and theta1
 
     Args:
-        mileages: List of mileage values (normalized)
-        prices: List of price values (normalized)
+        mileages: List or ndarray of mileage values (normalized); converted
+                  to C-contiguous float64 (no copy if it already is)
+        prices: List or ndarray of price values (normalized), same length
         learning_rate: Learning rate (alpha)
-        iterations: Maximum number of iterations
+        iterations: Maximum number of iterations (epochs in mini-batch mode)
         verbose: Print progress information
+        batch_size: Samples per update for mini-batch gradient descent;
+                    None uses the full batch every iteration
+        shuffle: Visit samples in a new random order each epoch
+                 (mini-batch mode only)
+        track_cost: Record the cost of every iteration; skipping it saves
+                    one reduction per iteration
 
     Returns:
-        tuple: (theta0, theta1, cost_history)
+        tuple: (theta0, theta1, cost_history) with cost_history as ndarray,
+               or None when track_cost is False
     """
-    m = len(prices)
+    # Single conversion point for every caller: the kernel's compiled
+    # signature needs C-contiguous float64 (no copy if already so)
+    mileages = np.ascontiguousarray(mileages, dtype=np.float64)
+    prices = np.ascontiguousarray(prices, dtype=np.float64)
+
+    m = prices.shape[0]
     theta0 = 0.0
     theta1 = 0.0
-    cost_history = []
 
     if verbose:
         print(f"\n{'='*60}")
@@ -46,35 +194,51 @@ def gradient_descent(mileages, prices, learning_rate=0.01, iterations=1000,
         print(f"Training samples: {m}")
         print(f"Learning rate: {learning_rate}")
         print(f"Max iterations: {iterations}")
+        if batch_size is not None:
+            print(f"Batch size: {batch_size}")
         print(f"{'='*60}\n")
 
-    for i in range(iterations):
-        # Calculate predictions and errors for all samples
-        predictions = [estimate_price(km, theta0, theta1) for km in mileages]
-        errors = [pred - actual for pred, actual in zip(predictions, prices)]
-
-        # Calculate gradients (from PDF formulas)
-        # tmpθ₀ = learningRate × (1/m) × Σ(errors)
-        # tmpθ₁ = learningRate × (1/m) × Σ(errors × mileage)
-
-        gradient_theta0 = sum(errors) / m
-        gradient_theta1 = sum(err * km for err, km in zip(errors, mileages)) / m
-
-        # Update parameters SIMULTANEOUSLY
-        tmp_theta0 = theta0 - (learning_rate * gradient_theta0)
-        tmp_theta1 = theta1 - (learning_rate * gradient_theta1)
-
-        theta0 = tmp_theta0
-        theta1 = tmp_theta1
-
-        # Calculate and store cost
-        cost = calculate_cost(mileages, prices, theta0, theta1)
-        cost_history.append(cost)
-
-        # Print progress
-        if verbose and (i % 100 == 0 or i == iterations - 1):
-            print(f"Iteration {i:4d} | Cost: {cost:.6f} | "
-                  f"θ₀: {theta0:8.4f} | θ₁: {theta1:8.4f}")
+    # Pure compute runs between progress checkpoints; only checkpoints print
+    if verbose:
+        checkpoints = list(range(0, iterations, LOG_EVERY))
+        if iterations > 0 and checkpoints[-1] != iterations - 1:
+            checkpoints.append(iterations - 1)
+    else:
+        checkpoints = [iterations - 1] if iterations > 0 else []
+
+    use_kernel = NUMBA_AVAILABLE and batch_size is None
+
+    cost_history = np.empty(iterations, dtype=np.float64) if track_cost else None
+
+    def run(theta0, theta1, lo, hi):
+        """Run iterations [lo, hi), recording their costs in cost_history"""
+        if use_kernel:
+            theta0, theta1, costs = _gd_kernel(
+                mileages, prices, theta0, theta1, learning_rate, hi - lo,
+                track_cost
+            )
+            if track_cost:
+                cost_history[lo:hi] = costs
+        else:
+            cost_out = cost_history[lo:hi] if track_cost else None
+            theta0, theta1 = _gd_segment(
+                mileages, prices, theta0, theta1, learning_rate, hi - lo,
+                cost_out, batch_size, shuffle
+            )
+        return theta0, theta1
+
+    start = 0
+    for i in checkpoints:
+        # Stop just before iteration i so the logged thetas are the ones
+        # whose cost iteration i records (cost is taken before the update)
+        theta0, theta1 = run(theta0, theta1, start, i)
+        logged_theta0, logged_theta1 = theta0, theta1
+        theta0, theta1 = run(theta0, theta1, i, i + 1)
+        start = i + 1
+
+        if verbose:
+            cost = cost_history[i] if track_cost else None
+            _print_progress(i, cost, logged_theta0, logged_theta1)
 
     if verbose:
         print(f"\n{'='*60}")
@@ -84,29 +248,47 @@ def gradient_descent(mileages, prices, learning_rate=0.01, iterations=1000,
     return theta0, theta1, cost_history
 
 
-def main():
-    """Main training function"""
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Train the linear regression model")
+    parser.add_argument(
+        '--method', choices=['gd', 'normal'], default='gd',
+        help="'gd' for gradient descent (default), "
+             "'normal' for the closed-form normal equation"
+    )
+    parser.add_argument(
+        '--batch-size', type=int, default=None,
+        help="samples per update for mini-batch gradient descent "
+             "(default: full batch)"
+    )
+    parser.add_argument(
+        '--no-cost', action='store_true',
+        help="skip per-iteration cost tracking and the cost history file"
+    )
+    args = parser.parse_args()
 
-    print("\n" + "="*60)
-    print("  LINEAR REGRESSION TRAINING")
-    print("="*60)
+    if args.batch_size is not None and args.batch_size <= 0:
+        parser.error("--batch-size must be a positive integer")
 
-    # Step 1: Load data
-    print("\n[1/5] Loading data...")
-    mileages, prices = load_data('data/data.csv')
+    return args
 
-    if mileages is None or prices is None:
-        print("❌ Failed to load data")
-        return
 
-    print(f"✓ Loaded {len(mileages)} training examples")
-    print(f"  Mileage range: {min(mileages):.0f} - {max(mileages):.0f} km")
-    print(f"  Price range: {min(prices):.0f} - {max(prices):.0f}")
+def train_gradient_descent(mileages, prices, batch_size=None, track_cost=True):
+    """
+    Steps 2-4: normalize, run gradient descent, convert to original scale
+
+    Args:
+        batch_size: Mini-batch size, or None for full-batch gradient descent
+        track_cost: Record cost history (None is returned when False)
 
+    Returns:
+        tuple: (theta0, theta1, cost_history, normalization_params)
+    """
     # Step 2: Normalize data
     print("\n[2/5] Normalizing data...")
-    norm_mileages, km_mean, km_std = normalize_data(mileages)
-    norm_prices, price_mean, price_std = normalize_data(prices)
+    (norm_mileages, norm_prices), means, stds = normalize_pair(mileages, prices)
+    km_mean, price_mean = float(means[0]), float(means[1])
+    km_std, price_std = float(stds[0]), float(stds[1])
 
     print(f"✓ Data normalized")
     print(f"  Mileage: μ={km_mean:.2f}, σ={km_std:.2f}")
@@ -124,23 +306,19 @@ def main():
         norm_prices,
         learning_rate=LEARNING_RATE,
         iterations=ITERATIONS,
-        verbose=True
+        verbose=True,
+        batch_size=batch_size,
+        track_cost=track_cost
     )
 
     # Step 4: Denormalize parameters
     print("\n[4/5] Converting to original scale...")
     theta0, theta1 = denormalize_theta(
-        theta0_norm, theta1_norm,
+        float(theta0_norm), float(theta1_norm),
         km_mean, km_std,
         price_mean, price_std
     )
 
-    print(f"✓ Final parameters:")
-    print(f"  θ₀ (intercept): {theta0:.4f}")
-    print(f"  θ₁ (slope): {theta1:.8f}")
-
-    # Step 5: Save parameters
-    print("\n[5/5] Saving model...")
     normalization_params = {
         'km_mean': km_mean,
         'km_std': km_std,
@@ -148,17 +326,83 @@ def main():
         'price_std': price_std
     }
 
+    return theta0, theta1, cost_history, normalization_params
+
+
+def train_normal_equation(mileages, prices):
+    """
+    Steps 2-4: solve the normal equation directly on the original scale
+
+    Returns:
+        tuple: (theta0, theta1, cost_history, normalization_params)
+               cost_history and normalization_params are None
+    """
+    print("\n[2/5] Normalizing data... skipped (closed form)")
+
+    print("\n[3/5] Solving normal equation...")
+    theta0, theta1 = fit_closed_form(mileages, prices)
+    print("✓ Closed-form solution found")
+
+    print("\n[4/5] Parameters already in original scale")
+
+    return theta0, theta1, None, None
+
+
+def main():
+    """Main training function"""
+    args = parse_args()
+
+    print("\n" + "="*60)
+    print("  LINEAR REGRESSION TRAINING")
+    print("="*60)
+
+    # Step 1: Load data
+    print("\n[1/5] Loading data...")
+    mileages, prices = load_data('data/data.csv')
+
+    if mileages is None or prices is None:
+        print("❌ Failed to load data")
+        return
+
+    print(f"✓ Loaded {len(mileages)} training examples")
+    print(f"  Mileage range: {min(mileages):.0f} - {max(mileages):.0f} km")
+    print(f"  Price range: {min(prices):.0f} - {max(prices):.0f}")
+
+    # Steps 2-4: Fit parameters
+    if args.method == 'normal':
+        theta0, theta1, cost_history, normalization_params = (
+            train_normal_equation(mileages, prices)
+        )
+    else:
+        theta0, theta1, cost_history, normalization_params = (
+            train_gradient_descent(mileages, prices, args.batch_size,
+                                   track_cost=not args.no_cost)
+        )
+
+    print(f"✓ Final parameters:")
+    print(f"  θ₀ (intercept): {theta0:.4f}")
+    print(f"  θ₁ (slope): {theta1:.8f}")
+
+    # Step 5: Save parameters
+    print("\n[5/5] Saving model...")
     save_theta(theta0, theta1, normalization_params=normalization_params)
+    if cost_history is not None:
+        # Mini-batch runs record one cost per epoch, not per update
+        unit = 'epoch' if args.batch_size is not None else 'iteration'
+        save_cost_history(cost_history, unit=unit)
+    else:
+        # --method normal / --no-cost: an older file would describe another run
+        remove_cost_history()
 
     # Show some example predictions
     print("\n" + "="*60)
     print("  EXAMPLE PREDICTIONS")
     print("="*60)
 
-    test_mileages = [50000, 100000, 150000, 200000]
-    for km in test_mileages:
-        predicted_price = estimate_price(km, theta0, theta1)
-        print(f"  {km:6d} km → {predicted_price:7.2f} €")
+    test_mileages = np.array([50000, 100000, 150000, 200000], dtype=np.float64)
+    predicted_prices = estimate_price(test_mileages, theta0, theta1)
+    for km, predicted_price in zip(test_mileages, predicted_prices):
+        print(f"  {km:6.0f} km → {predicted_price:7.2f} €")
 
     print("\n" + "="*60)
     print("✓ Training complete! Use predict.py to make predictions.")
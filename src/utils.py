@@ -2,30 +2,39 @@
 Utility functions for linear regression implementation
 """
 import json
-import csv
 import os
 
+import numpy as np
+
 
 def load_data(filepath='data/data.csv'):
     """
-    Load training data from CSV file
+    Load training data from CSV file straight into NumPy arrays
 
     Args:
         filepath: Path to CSV file with 'km' and 'price' columns
 
     Returns:
-        tuple: (mileages, prices) as lists of floats
+        tuple: (mileages, prices) as float64 ndarrays
     """
-    mileages = []
-    prices = []
-
     try:
+        # Drop CSV quoting ("240000","3650") like csv.DictReader did;
+        # usemask=True masks empty fields; unparsable fields become NaN
         with open(filepath, 'r') as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                if row['km'] and row['price']:  # Skip empty rows
-                    mileages.append(float(row['km']))
-                    prices.append(float(row['price']))
+            lines = [line.replace('"', '') for line in file]
+        data = np.atleast_1d(np.genfromtxt(lines, delimiter=',', names=True,
+                                           dtype=np.float64, usemask=True))
+        mileages = data['km']
+        prices = data['price']
+
+        # Skip rows with an empty field, like the original csv-based loader
+        filled = ~(np.ma.getmaskarray(mileages) | np.ma.getmaskarray(prices))
+        mileages = np.ma.getdata(mileages)[filled]
+        prices = np.ma.getdata(prices)[filled]
+
+        # Any remaining NaN came from a field that is not a number
+        if np.isnan(mileages).any() or np.isnan(prices).any():
+            raise ValueError("non-numeric value in 'km' or 'price' column")
     except FileNotFoundError:
         print(f"Error: {filepath} not found")
         return None, None
@@ -33,35 +42,64 @@ def load_data(filepath='data/data.csv'):
         print(f"Error loading data: {e}")
         return None, None
 
-    return mileages, prices
+    return np.ascontiguousarray(mileages), np.ascontiguousarray(prices)
 
 
 def normalize_data(data):
     """
     Normalize data using mean and standard deviation
 
+    Public helper for a single series; train.py normalizes mileages and
+    prices together with normalize_pair.
+
     Args:
-        data: List of numerical values
+        data: List or ndarray of numerical values
 
     Returns:
-        tuple: (normalized_data, mean, std)
+        tuple: (normalized_data, mean, std) with normalized_data as ndarray
     """
-    if not data:
-        return [], 0, 1
+    arr = np.asarray(data, dtype=np.float64)
+    if arr.size == 0:
+        return arr, 0.0, 1.0
 
-    mean = sum(data) / len(data)
-
-    # Calculate standard deviation manually
-    variance = sum((x - mean) ** 2 for x in data) / len(data)
-    std = variance ** 0.5
+    mean = float(arr.mean())
+    std = float(arr.std())
 
     # Avoid division by zero
     if std == 0:
-        std = 1
+        std = 1.0
+
+    return (arr - mean) / std, mean, std
+
+
+def normalize_pair(mileages, prices):
+    """
+    Normalize mileages and prices together
+
+    Both series are stacked into a (2, m) array so each statistic is
+    computed for both rows by one call along axis 1 (one mean call and
+    one std call) instead of once per series.
+
+    Args:
+        mileages: List or ndarray of mileage values
+        prices: List or ndarray of price values (same length)
 
-    normalized = [(x - mean) / std for x in data]
+    Returns:
+        tuple: (normalized, means, stds) where normalized has shape (2, m)
+               and means/stds are [mileage, price] arrays
+    """
+    data = np.stack([np.asarray(mileages, dtype=np.float64),
+                     np.asarray(prices, dtype=np.float64)])
+    if data.shape[1] == 0:
+        return data, np.zeros(2), np.ones(2)
+
+    means = data.mean(axis=1, keepdims=True)
+    stds = data.std(axis=1, keepdims=True)
 
-    return normalized, mean, std
+    # Avoid division by zero
+    stds[stds == 0] = 1.0
+
+    return (data - means) / stds, means.ravel(), stds.ravel()
 
 
 def denormalize_theta(theta0_norm, theta1_norm, km_mean, km_std, price_mean, price_std):
@@ -94,6 +132,36 @@ def denormalize_theta(theta0_norm, theta1_norm, km_mean, km_std, price_mean, pri
     return theta0, theta1
 
 
+def fit_closed_form(mileages, prices):
+    """
+    Fit theta0 and theta1 directly with the least-squares normal equation
+
+    Formula:
+        theta1 = Σ((km - km_mean) * (price - price_mean)) / Σ((km - km_mean)^2)
+        theta0 = price_mean - theta1 * km_mean
+
+    Args:
+        mileages: List or ndarray of mileage values (original scale)
+        prices: List or ndarray of price values (original scale)
+
+    Returns:
+        tuple: (theta0, theta1) in original scale
+    """
+    x = np.asarray(mileages, dtype=np.float64)
+    y = np.asarray(prices, dtype=np.float64)
+
+    x_mean = x.mean()
+    y_mean = y.mean()
+    x_dev = x - x_mean
+
+    # Constant mileage: slope is undefined, fall back to the mean price
+    ss_x = x_dev @ x_dev
+    theta1 = float((x_dev @ (y - y_mean)) / ss_x) if ss_x != 0 else 0.0
+    theta0 = float(y_mean - theta1 * x_mean)
+
+    return theta0, theta1
+
+
 def save_theta(theta0, theta1, filepath='models/theta.json',
                normalization_params=None):
     """
@@ -151,21 +219,126 @@ def load_theta(filepath='models/theta.json'):
         return 0, 0, None
 
 
+def _cost_history_meta_path(filepath):
+    """Path of the JSON file describing a saved cost history"""
+    return os.path.splitext(filepath)[0] + '.json'
+
+
+def save_cost_history(cost_history, filepath='models/cost_history.npy',
+                      unit='iteration'):
+    """
+    Save training cost history as a binary NumPy file
+
+    The unit of each entry ('iteration', or 'epoch' for mini-batch runs)
+    is stored next to it in a small JSON file.
+
+    Args:
+        cost_history: Sequence of cost values, one per iteration or epoch
+        filepath: Path to save file
+        unit: What one entry of cost_history stands for
+    """
+    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+
+    try:
+        np.save(filepath, np.asarray(cost_history, dtype=np.float64))
+        with open(_cost_history_meta_path(filepath), 'w') as file:
+            json.dump({'unit': unit}, file, indent=2)
+        print(f"✓ Cost history saved to {filepath}")
+    except Exception as e:
+        print(f"Error saving cost history: {e}")
+
+
+def load_cost_history(filepath='models/cost_history.npy'):
+    """
+    Load training cost history saved by save_cost_history
+
+    Args:
+        filepath: Path to saved cost history file
+
+    Returns:
+        tuple: (cost_history, unit) with cost_history memory-mapped
+               Returns (None, None) if file doesn't exist
+    """
+    if not os.path.exists(filepath):
+        return None, None
+
+    try:
+        cost_history = np.load(filepath, mmap_mode='r')
+
+        unit = 'iteration'
+        meta_path = _cost_history_meta_path(filepath)
+        if os.path.exists(meta_path):
+            with open(meta_path, 'r') as file:
+                unit = json.load(file).get('unit', 'iteration')
+
+        return cost_history, unit
+    except Exception as e:
+        print(f"Error loading cost history: {e}")
+        return None, None
+
+
+def remove_cost_history(filepath='models/cost_history.npy'):
+    """
+    Delete a saved cost history so it can't be mistaken for the current run
+
+    Args:
+        filepath: Path to saved cost history file
+    """
+    if not os.path.exists(filepath):
+        return
+
+    try:
+        os.remove(filepath)
+        meta_path = _cost_history_meta_path(filepath)
+        if os.path.exists(meta_path):
+            os.remove(meta_path)
+        print(f"✓ Removed stale cost history {filepath}")
+    except Exception as e:
+        print(f"Error removing cost history: {e}")
+
+
 def estimate_price(mileage, theta0, theta1):
     """
     Estimate price using linear hypothesis
 
+    Broadcasts over NumPy arrays, so a whole dataset can be estimated
+    with a single call instead of one call per sample.
+
     Args:
-        mileage: Mileage value (km)
+        mileage: Mileage value (km) or ndarray of mileages
         theta0: Intercept parameter
         theta1: Slope parameter
 
     Returns:
-        float: Estimated price
+        float or ndarray: Estimated price(s)
     """
     return theta0 + (theta1 * mileage)
 
 
+def make_predictor(theta0, theta1):
+    """
+    Build a price estimator with theta0 and theta1 bound once
+
+    The hypothesis itself stays in estimate_price; this only binds the
+    parameters and converts inputs to float64 arrays.
+
+    Args:
+        theta0: Intercept parameter
+        theta1: Slope parameter
+
+    Returns:
+        function: predictor(mileages) -> estimated prices (scalar or ndarray)
+    """
+    theta0 = float(theta0)
+    theta1 = float(theta1)
+
+    def predictor(mileages):
+        return estimate_price(np.asarray(mileages, dtype=np.float64),
+                              theta0, theta1)
+
+    return predictor
+
+
 def calculate_cost(mileages, prices, theta0, theta1):
     """
     Calculate Mean Squared Error cost function
@@ -173,22 +346,20 @@ def calculate_cost(mileages, prices, theta0, theta1):
     Cost = (1/2m) * Σ(estimate_price(mileage[i]) - price[i])^2
 
     Args:
-        mileages: List of mileage values
-        prices: List of actual prices
+        mileages: List or ndarray of mileage values
+        prices: List or ndarray of actual prices
         theta0: Current intercept parameter
         theta1: Current slope parameter
 
     Returns:
         float: Cost value
     """
-    m = len(prices)
+    mileages = np.asarray(mileages, dtype=np.float64)
+    prices = np.asarray(prices, dtype=np.float64)
+
+    m = prices.shape[0]
     if m == 0:
         return 0
 
-    total_error = 0
-    for i in range(m):
-        prediction = estimate_price(mileages[i], theta0, theta1)
-        error = prediction - prices[i]
-        total_error += error ** 2
-
-    return total_error / (2 * m)
+    errors = estimate_price(mileages, theta0, theta1) - prices
+    return float(errors @ errors) / (2 * m)